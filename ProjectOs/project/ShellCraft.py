@@ -1,32 +1,62 @@
 import sys
 import os
+import re
 import subprocess
 import shlex
+import shutil
+import threading
+from collections import namedtuple
 from smart_insights import display_error
 
 # --- Autocorrect + learning system ---
 from autocorrect import (
     autocorrect_command,
     learn_command,
-    load_learned_commands,
-    COMMON_COMMANDS
 )
 
 # --- Autocomplete system ---
 from autocomplete import setup_autocomplete
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux pipes start at 16 KiB; 64 KiB means far fewer read() calls per command.
+PIPE_SIZE = 65536
+
+
+def _grow_pipe(fd):
+    """Best-effort resize of a pipe to PIPE_SIZE (Linux only)."""
+    if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+    except OSError:
+        pass
+
 
 # --- Built-in Commands ---
 
+# The working directory only changes through 'cd', so it and the prompt
+# built from it are cached instead of calling os.getcwd() per prompt.
+_cwd = os.getcwd()
+_prompt = f"shellcraft:{_cwd}> "
+
+
 def shell_cd(args):
     """Built-in 'cd' command."""
     # Go to the home directory if 'cd' is called without an argument
     target_dir = os.path.expanduser("~") if len(args) < 2 else args[1]
 
+    global _cwd, _prompt
     try:
         os.chdir(target_dir)
     except FileNotFoundError:
         print(f"shellcraft: cd: no such file or directory: {target_dir}", file=sys.stderr)
+    else:
+        _cwd = os.getcwd()
+        _prompt = f"shellcraft:{_cwd}> "
     return 1  # Return 1 to continue the shell loop
 
 
@@ -60,30 +90,173 @@ else:
     ALIASES = {}
 
 
+def resolve_alias(command_args):
+    """Expand a platform alias in argv[0] (e.g. 'touch' -> 'type nul >')."""
+    alias = ALIASES.get(command_args[0])
+    if alias is None:
+        return command_args
+    return shlex.split(alias) + command_args[1:]
+
+
+# --- Direct Spawn ---
+# Plain commands are launched with os.posix_spawn, which skips Popen's
+# fork + close_fds sweep. stdout goes straight to the terminal; stderr is
+# captured for smart insights.
+
+# posix_spawn is the primary path for single commands wherever it exists.
+_CAN_SPAWN = hasattr(os, "posix_spawn") and sys.platform != "win32"
+
+_WHICH_CACHE = {}
+
+
+def _which(name):
+    """shutil.which() cached per (name, PATH). Misses are not cached, so
+    binaries installed mid-session are still found."""
+    key = (name, os.environ.get("PATH", ""))
+    path = _WHICH_CACHE.get(key)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _WHICH_CACHE[key] = path
+    return path
+
+
+def _run_spawned(command_args):
+    """Run a single command via os.posix_spawn, with smart error insights."""
+    path = _which(command_args[0])
+    if path is None:
+        display_error(" ".join(command_args), f"Command not found: {command_args[0]}")
+        return 1
+
+    err_read, err_write = os.pipe()
+    sys.stdout.flush()
+    try:
+        pid = os.posix_spawn(path, command_args, os.environ,
+                             file_actions=[(os.POSIX_SPAWN_DUP2, err_write, 2)])
+    except OSError as e:
+        os.close(err_read)
+        display_error(" ".join(command_args), str(e))
+        return 1
+    finally:
+        os.close(err_write)
+
+    try:
+        with os.fdopen(err_read, "rb") as err:
+            stderr = err.read().decode(errors="replace")
+    finally:
+        # Always reap the child, even if Ctrl+C interrupted the read.
+        _, status = os.waitpid(pid, 0)
+
+    if os.waitstatus_to_exitcode(status) != 0 and stderr:
+        display_error(" ".join(command_args), stderr)
+
+    learn_command(command_args[0])
+    return 1
+
+
+# --- Pipeline Helpers ---
+
+def _drain(stream):
+    """Read a child's stderr in the background; returns a getter for the text."""
+    chunks = []
+    reader = threading.Thread(target=lambda: chunks.append(stream.read()), daemon=True)
+    reader.start()
+
+    def result():
+        reader.join()
+        stream.close()
+        return b"".join(chunks).decode(errors="replace")
+
+    return result
+
+
+def _stream_to_stdout(pipe):
+    """Copy a child's stdout to ours chunk by chunk, without buffering it all."""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    with pipe:
+        while True:
+            chunk = pipe.read1(PIPE_SIZE)
+            if not chunk:
+                break
+            out.write(chunk)
+            out.flush()
+
+
+def _abort_pipeline(processes, prev_pipe, stdout_fd):
+    """Tear down a partially started pipeline after a launch failure."""
+    if prev_pipe is not None and prev_pipe != sys.stdin:
+        prev_pipe.close()
+    for proc, _, stderr in processes:
+        proc.wait()
+        stderr()
+    if stdout_fd != sys.stdout:
+        stdout_fd.close()
+
+
 # --- Core Execution Logic ---
 
-def execute_commands(commands):
+# Redirection targets pulled out of a parsed line: '<' from the first stage
+# and '>' from the last one. Either may be None.
+Redirection = namedtuple("Redirection", ["stdin", "stdout"])
+NO_REDIRECTION = Redirection(None, None)
+
+
+def _strip_redirections(args):
+    """Remove '<'/'>' and their filenames from one stage in a single pass."""
+    stripped = []
+    targets = {'<': None, '>': None}
+    tokens = iter(args)
+    for token in tokens:
+        if token in targets:
+            filename = next(tokens, None)
+            if filename is None or filename in targets:
+                raise ValueError(f"syntax error near '{token}'")
+            targets[token] = filename
+        else:
+            stripped.append(token)
+    return stripped, targets['<'], targets['>']
+
+
+def split_redirections(commands):
+    """Return (commands, Redirection) with redirection tokens stripped.
+
+    Only the first stage may read from a file and only the last may write
+    to one; anything else is a syntax error rather than silently dropped.
+    """
+    if not commands:
+        return commands, NO_REDIRECTION
+    stripped = []
+    stdin_file = stdout_file = None
+    last = len(commands) - 1
+    for i, args in enumerate(commands):
+        args, stage_in, stage_out = _strip_redirections(args)
+        if stage_in is not None and i > 0:
+            raise ValueError("syntax error near '<'")
+        if stage_out is not None and i < last:
+            raise ValueError("syntax error near '>'")
+        stdin_file = stdin_file or stage_in
+        stdout_file = stdout_file or stage_out
+        stripped.append(args)
+    return stripped, Redirection(stdin_file, stdout_file)
+
+
+def execute_commands(commands, redirection=NO_REDIRECTION):
     """Executes a list of commands, handling pipes and I/O redirection."""
     stdin_fd = sys.stdin
     stdout_fd = sys.stdout
 
     # Handle input redirection '<'
-    if '<' in commands[0]:
-        index = commands[0].index('<')
-        filename = commands[0][index + 1]
+    if redirection.stdin is not None:
         try:
-            stdin_fd = open(filename, 'r')
+            stdin_fd = open(redirection.stdin, 'r')
         except FileNotFoundError:
-            print(f"shellcraft: no such file or directory: {filename}", file=sys.stderr)
+            print(f"shellcraft: no such file or directory: {redirection.stdin}", file=sys.stderr)
             return 1
-        commands[0] = commands[0][:index]
 
     # Handle output redirection '>'
-    if '>' in commands[-1]:
-        index = commands[-1].index('>')
-        filename = commands[-1][index + 1]
-        stdout_fd = open(filename, 'w')
-        commands[-1] = commands[-1][:index]
+    if redirection.stdout is not None:
+        stdout_fd = open(redirection.stdout, 'w')
 
     processes = []
     prev_pipe = stdin_fd
@@ -93,57 +266,82 @@ def execute_commands(commands):
             continue
 
         # --- Inline autocorrect ---
-        command_args[0] = autocorrect_command(command_args[0])
+        # Interned so the builtin lookup below can match on identity
+        # (BUILTIN_COMMANDS keys are literals and already interned).
+        command_args[0] = sys.intern(autocorrect_command(command_args[0]))
         # --------------------------
 
         # Handle built-in commands
         if command_args[0] in BUILTIN_COMMANDS:
             if i > 0:  # Built-ins cannot be on the receiving end of a pipe
                 print("shellcraft: built-in commands cannot be piped.", file=sys.stderr)
+                _abort_pipeline(processes, prev_pipe, stdout_fd)
                 return 1
             return BUILTIN_COMMANDS[command_args[0]](command_args)
 
+        # Plain single commands are launched with posix_spawn; pipes,
+        # redirections and Windows keep using subprocess below.
+        if _CAN_SPAWN and len(commands) == 1 and stdin_fd is sys.stdin and stdout_fd is sys.stdout:
+            return _run_spawned(command_args)
+
         is_last_command = (i == len(commands) - 1)
-        use_shell = sys.platform == "win32"
+
+        # On Windows, only go through cmd.exe for its built-ins (dir, copy,
+        # type, ...); real executables are launched directly.
+        command_args = resolve_alias(command_args)
+        use_shell = sys.platform == "win32" and _which(command_args[0]) is None
+
+        # Intermediate stages pipe into the next one; the last stage writes
+        # to the redirect target, or is streamed to the terminal below.
+        if is_last_command and stdout_fd is not sys.stdout:
+            stage_stdout = stdout_fd
+        else:
+            stage_stdout = subprocess.PIPE
 
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 command_args,
+                executable=None if use_shell else _which(command_args[0]),
                 stdin=prev_pipe,
-                stdout=subprocess.PIPE,
+                stdout=stage_stdout,
                 stderr=subprocess.PIPE,
-                text=True,
-                shell=use_shell
+                shell=use_shell,
+                bufsize=PIPE_SIZE
             )
-
-            # Print output normally
-            if result.stdout:
-                print(result.stdout, end="")
-
-            # Handle errors with smart insights
-            if result.returncode != 0 and result.stderr:
-                display_error(" ".join(command_args), result.stderr)
-
-            learn_command(command_args[0])
-
-            # Manage pipes
-            if prev_pipe != sys.stdin:
-                prev_pipe.close()
-
-            prev_pipe = result.stdout
-
         except FileNotFoundError:
             display_error(" ".join(command_args), f"Command not found: {command_args[0]}")
+            _abort_pipeline(processes, prev_pipe, stdout_fd)
             return 1
-
         except Exception as e:
             display_error(" ".join(command_args), str(e))
+            _abort_pipeline(processes, prev_pipe, stdout_fd)
             return 1
 
+        if proc.stdout is not None:
+            _grow_pipe(proc.stdout.fileno())
+        processes.append((proc, command_args, _drain(proc.stderr)))
+
+        # Manage pipes: the child holds its own copy of the read end now
+        if prev_pipe != sys.stdin:
+            prev_pipe.close()
+
+        prev_pipe = proc.stdout
+
+    # Stream the final stage's output as it arrives
+    if processes and prev_pipe is not None and prev_pipe is processes[-1][0].stdout:
+        _stream_to_stdout(prev_pipe)
+
     # Wait for all child processes to complete
-    for proc in processes:
+    for proc, command_args, stderr in processes:
         proc.wait()
 
+        # Handle errors with smart insights
+        stderr = stderr()
+        if proc.returncode != 0 and stderr:
+            display_error(" ".join(command_args), stderr)
+
+        learn_command(command_args[0])
+
     # Clean up the file descriptor if we redirected output
     if stdout_fd != sys.stdout:
         stdout_fd.close()
@@ -151,6 +349,49 @@ def execute_commands(commands):
     return 1
 
 
+# --- Line Parsing ---
+
+# Fast-path tokenizer for lines without quotes or escapes: words plus runs
+# of the operator characters |, < and > (one token per run, as shlex does).
+_TOKEN_RE = re.compile(r"[^\s|<>]+|[|<>]+")
+# Quoted or escaped text, masked out before looking for fd redirections.
+_QUOTED_RE = re.compile(r"'[^']*'|\"(?:\\.|[^\"\\])*\"|\\.")
+# An fd number glued to a redirection, e.g. '2>' or '0<'.
+_FD_REDIRECT_RE = re.compile(r"(?:^|(?<=[\s|<>]))(\d+[<>])")
+_OPERATOR_CHARS = "|<>"
+
+
+def _tokenize(line):
+    """Split a line into words and operators, the same way on both paths."""
+    if '"' in line or "'" in line or "\\" in line:
+        lexer = shlex.shlex(line, posix=True, punctuation_chars=_OPERATOR_CHARS)
+        lexer.whitespace_split = True
+        lexer.commenters = ""
+        tokens = list(lexer)
+        bare = _QUOTED_RE.sub("_", line)
+    else:
+        tokens = _TOKEN_RE.findall(line)
+        bare = line
+
+    fd_redirect = _FD_REDIRECT_RE.search(bare)
+    if fd_redirect:
+        raise ValueError(f"unsupported redirection '{fd_redirect.group(1)}'")
+    return tokens
+
+
+def parse_line(line):
+    """Split an input line into a list of argv lists, one per pipe stage."""
+    commands = [[]]
+    for token in _tokenize(line):
+        if len(token) > 1 and not token.strip(_OPERATOR_CHARS):
+            raise ValueError(f"unsupported operator '{token}'")  # '>>', '||', ...
+        if token == '|':
+            commands.append([])
+        else:
+            commands[-1].append(token)
+    return commands
+
+
 # --- Main Shell Loop ---
 
 def shell_loop():
@@ -158,23 +399,22 @@ def shell_loop():
     status = 1
     while status:
         try:
-            # Create a prompt that shows the current directory
-            current_dir = os.getcwd()
-            prompt = f"shellcraft:{current_dir}> "
-            line = input(prompt)
+            # The prompt shows the current directory (cached, see shell_cd)
+            line = input(_prompt)
 
             if not line.strip():
                 continue
 
             # Parse the line into commands, splitting by pipes
-            command_strings = line.split('|')
-            commands = [shlex.split(cmd) for cmd in command_strings]
+            commands, redirection = split_redirections(parse_line(line))
 
-            status = execute_commands(commands)
+            status = execute_commands(commands, redirection)
 
         except EOFError:  # User pressed Ctrl+D
             print("\nExiting ShellCraft.")
             break
+        except ValueError as e:  # Unbalanced quotes, bad '<' / '>' / '|'
+            print(f"shellcraft: {e}", file=sys.stderr)
         except KeyboardInterrupt:  # User pressed Ctrl+C
             print()  # Move to a new line
             continue
@@ -182,7 +422,7 @@ def shell_loop():
 
 def main():
     """Main entry point for the shell."""
-    setup_autocomplete(command_list_getter=lambda: load_learned_commands() + COMMON_COMMANDS)
+    setup_autocomplete()
     shell_loop()
 
 
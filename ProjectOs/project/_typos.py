@@ -0,0 +1,345 @@
+# _typos.py
+"""
+Typo -> command table for autocorrect, generated from
+autocorrect.COMMON_TYPOS so importing it does no work at startup.
+
+Regenerate after editing COMMON_TYPOS:
+    python -c "import autocorrect; autocorrect.write_typo_table()"
+"""
+
+TYPO_CORRECTIONS = {
+    "sl": "ls",
+    "lz": "ls",
+    "lx": "ls",
+    "lp": "ls",
+    "ld": "ls",
+    "la": "ls",
+    "lss": "less",
+    "lsz": "ls",
+    "lsx": "ls",
+    "lsq": "ls",
+    "lsw": "ls",
+    "lzs": "ls",
+    "lsd": "ls",
+    "ls1": "ls",
+    "ls;": "ls",
+    "l.s": "ls",
+    "l-s": "ls",
+    "cta": "cat",
+    "ct": "cat",
+    "act": "cat",
+    "cqt": "cat",
+    "cst": "cat",
+    "czt": "cat",
+    "cag": "cat",
+    "catt": "cat",
+    "caa": "cat",
+    "cwt": "cat",
+    "ctt": "cat",
+    "car": "cat",
+    "catr": "cat",
+    "ctq": "cat",
+    "caat": "cat",
+    "cay": "cat",
+    "caz": "cat",
+    "gtep": "grep",
+    "gerp": "grep",
+    "grp": "grep",
+    "greo": "grep",
+    "geep": "grep",
+    "grpe": "grep",
+    "gref": "grep",
+    "grepp": "grep",
+    "grrp": "grep",
+    "gtrep": "grep",
+    "gre;": "grep",
+    "grwp": "grep",
+    "grfp": "grep",
+    "gre0": "grep",
+    "grdp": "grep",
+    "greop": "grep",
+    "dc": "cd",
+    "vd": "cd",
+    "xd": "cd",
+    "cs": "cd",
+    "xv": "cd",
+    "sd": "cd",
+    "cz": "cd",
+    "cf": "cd",
+    "cx": "cd",
+    "cds": "cd",
+    "cdd": "cd",
+    "cfd": "cd",
+    "ccd": "cd",
+    "cvd": "cd",
+    "cd.": "cd",
+    "cd/": "cd",
+    "ehco": "echo",
+    "eho": "echo",
+    "eco": "echo",
+    "ecco": "echo",
+    "ech": "echo",
+    "ehoh": "echo",
+    "echp": "echo",
+    "echi": "echo",
+    "ech0": "echo",
+    "echu": "echo",
+    "eho0": "echo",
+    "ech9": "echo",
+    "ehc": "echo",
+    "echy": "echo",
+    "pdw": "pwd",
+    "pdd": "pwd",
+    "pw": "pwd",
+    "pwf": "pwd",
+    "pwr": "pwd",
+    "pwq": "pwd",
+    "pwe": "pwd",
+    "pww": "pwd",
+    "pwdc": "pwd",
+    "pwdx": "pwd",
+    "pwd1": "pwd",
+    "pwx": "pwd",
+    "pwdd": "pwd",
+    "pwde": "pwd",
+    "pwv": "pwd",
+    "ppwd": "pwd",
+    "mdkir": "mkdir",
+    "mkidr": "mkdir",
+    "mkdr": "mkdir",
+    "mkr": "mkdir",
+    "mkkir": "mkdir",
+    "mkdirr": "mkdir",
+    "mkdir1": "mkdir",
+    "mkid": "mkdir",
+    "mkrd": "mkdir",
+    "mkdir2": "mkdir",
+    "mkrir": "mkdir",
+    "mkrdr": "mkdir",
+    "mkkdir": "mkdir",
+    "rdmir": "rmdir",
+    "rmidr": "rmdir",
+    "rmdr": "rmdir",
+    "rmir": "rmdir",
+    "rmdirr": "rmdir",
+    "rmder": "rmdir",
+    "rmdir1": "rmdir",
+    "rmdir2": "rmdir",
+    "rmddr": "rmdir",
+    "rmdor": "rmdir",
+    "rmdjr": "rmdir",
+    "mr": "rm",
+    "rn": "rm",
+    "rmm": "rm",
+    "rmmr": "rm",
+    "rjm": "rm",
+    "rwm": "rm",
+    "rkm": "rm",
+    "rvm": "rm",
+    "rrm": "rm",
+    "rmn": "rm",
+    "r.m": "rm",
+    "r;m": "rm",
+    "rm,": "rm",
+    "rmmn": "rm",
+    "rmk": "rm",
+    "pc": "cp",
+    "cpo": "cp",
+    "cpp": "cp",
+    "cpq": "cp",
+    "c0p": "cp",
+    "cpl": "cp",
+    "cpi": "cp",
+    "cpz": "cp",
+    "cp;": "cp",
+    "cpm": "cp",
+    "cpx": "cp",
+    "cp,": "cp",
+    "cp1": "cp",
+    "ccp": "cp",
+    "cp2": "cp",
+    "vm": "mv",
+    "mn": "man",
+    "mvb": "mv",
+    "mvv": "mv",
+    "mvvv": "mv",
+    "mvf": "mv",
+    "mvc": "mv",
+    "mvg": "mv",
+    "mvd": "mv",
+    "mvn": "mv",
+    "mvx": "mv",
+    "mv;": "mv",
+    "mv,": "mv",
+    "mv1": "mv",
+    "mvvb": "mv",
+    "tuch": "touch",
+    "touc": "touch",
+    "touhc": "touch",
+    "tuchh": "touch",
+    "toch": "touch",
+    "toucj": "touch",
+    "touvh": "touch",
+    "tuchc": "touch",
+    "touchh": "touch",
+    "toucx": "touch",
+    "toucg": "touch",
+    "toucq": "touch",
+    "touh": "touch",
+    "touhch": "touch",
+    "tuchj": "touch",
+    "cler": "clear",
+    "claer": "clear",
+    "clera": "clear",
+    "cear": "clear",
+    "cla": "clear",
+    "clea": "clear",
+    "clrar": "clear",
+    "cleear": "clear",
+    "cleer": "clear",
+    "clwar": "clear",
+    "cldar": "clear",
+    "clqar": "clear",
+    "c;ear": "clear",
+    "c,lear": "clear",
+    "cleaf": "clear",
+    "exot": "exit",
+    "exiy": "exit",
+    "exut": "exit",
+    "exif": "exit",
+    "eixt": "exit",
+    "exiit": "exit",
+    "exi": "exit",
+    "exitx": "exit",
+    "exotx": "exit",
+    "exkt": "exit",
+    "exotq": "exit",
+    "exiot": "exit",
+    "exutx": "exit",
+    "fnid": "find",
+    "fidn": "find",
+    "fnd": "find",
+    "findd": "find",
+    "finn": "find",
+    "fihd": "find",
+    "fiod": "find",
+    "finf": "find",
+    "fijd": "find",
+    "fndd": "find",
+    "f8nd": "find",
+    "fjnd": "find",
+    "findf": "find",
+    "fins": "find",
+    "finds": "find",
+    "haed": "head",
+    "hed": "head",
+    "headd": "head",
+    "hrad": "head",
+    "hade": "head",
+    "heda": "head",
+    "hedd": "head",
+    "heaad": "head",
+    "hwad": "head",
+    "heqd": "head",
+    "heasd": "head",
+    "hesd": "head",
+    "hrsd": "head",
+    "hedr": "head",
+    "tali": "tail",
+    "tial": "tail",
+    "taol": "tail",
+    "tall": "tail",
+    "tiall": "tail",
+    "talii": "tail",
+    "taik": "tail",
+    "taill": "tail",
+    "taliq": "tail",
+    "tauk": "tail",
+    "tqil": "tail",
+    "tazl": "tail",
+    "srot": "sort",
+    "sotr": "sort",
+    "sor": "sort",
+    "soet": "sort",
+    "sot": "sort",
+    "sory": "sort",
+    "sor5": "sort",
+    "sortt": "sort",
+    "soort": "sort",
+    "sirt": "sort",
+    "so4t": "sort",
+    "s0rt": "sort",
+    "soert": "sort",
+    "sart": "sort",
+    "chomd": "chmod",
+    "chmd": "chmod",
+    "chdmo": "chmod",
+    "chdm": "chmod",
+    "chd": "chmod",
+    "chmdo": "chmod",
+    "chmdd": "chmod",
+    "chmof": "chmod",
+    "chmld": "chmod",
+    "chmxd": "chmod",
+    "chm0d": "chmod",
+    "chjmd": "chmod",
+    "chmop": "chmod",
+    "chonw": "chown",
+    "chowm": "chown",
+    "choen": "chown",
+    "chwon": "chown",
+    "chwonw": "chown",
+    "chownn": "chown",
+    "chowb": "chown",
+    "chowq": "chown",
+    "ch0wn": "chown",
+    "chawn": "chown",
+    "chown1": "chown",
+    "chownr": "chown",
+    "chownu": "chown",
+    "chownx": "chown",
+    "chownm": "chown",
+    "amn": "man",
+    "mna": "man",
+    "maan": "man",
+    "mamn": "man",
+    "mann": "man",
+    "manb": "man",
+    "manm": "man",
+    "mwn": "man",
+    "mzn": "man",
+    "mqn": "man",
+    "mab": "man",
+    "mnan": "man",
+    "man1": "man",
+    "manq": "man",
+    "lses": "less",
+    "les": "less",
+    "leess": "less",
+    "lesss": "less",
+    "lezs": "less",
+    "l3ss": "less",
+    "lews": "less",
+    "lsss": "less",
+    "lesx": "less",
+    "lessx": "less",
+    "lqss": "less",
+    "leas": "less",
+    "lesz": "less",
+    "mroe": "more",
+    "mre": "more",
+    "moer": "more",
+    "moee": "more",
+    "mor": "more",
+    "moree": "more",
+    "moore": "more",
+    "morf": "more",
+    "morz": "more",
+    "mo4e": "more",
+    "m0re": "more",
+    "mire": "more",
+    "mkre": "more",
+    "miree": "more",
+    "gti": "git",
+    "got": "git",
+}
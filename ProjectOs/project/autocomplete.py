@@ -14,15 +14,17 @@ Features:
 
 import sys
 import os
-import glob
+import bisect
+import functools
 
 # Try to use the same COMMON_COMMANDS and loader from your autocorrect module.
 # If you named it differently, change the import accordingly.
 try:
-    from autocorrect import COMMON_COMMANDS, load_learned_commands
+    from autocorrect import COMMON_COMMANDS, LEARN_FILE, load_learned_commands
 except Exception:
     # Fallback if module layout differs; user can provide list via setup function
     COMMON_COMMANDS = []
+    LEARN_FILE = None
     def load_learned_commands():
         return []
 
@@ -32,73 +34,92 @@ try:
 except Exception:
     readline = None
 
-# Keep an internal cache of the dynamic command list (COMMON + learned)
+def _learned_mtime():
+    """mtime of the learned-commands file, or None if it is missing."""
+    try:
+        return os.stat(LEARN_FILE).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+# Keep an internal cache of the dynamic command list (COMMON + learned),
+# rebuilt only when the learned-commands file changes.
 def _get_dynamic_commands():
-    """Return the up-to-date list of commands used for completion."""
+    """Return the up-to-date, sorted tuple of commands used for completion."""
+    return _build_dynamic_commands(_learned_mtime())
+
+@functools.lru_cache(maxsize=1)
+def _build_dynamic_commands(mtime):
+    """Merge COMMON_COMMANDS and learned commands; cached per file mtime."""
     learned = []
     try:
         learned = load_learned_commands() or []
     except Exception:
         learned = []
-    # Ensure uniqueness and preserve COMMON_COMMANDS order first
-    seen = set()
-    result = []
-    for c in COMMON_COMMANDS + learned:
-        if not isinstance(c, str):
-            continue
-        if c not in seen:
-            seen.add(c)
-            result.append(c)
-    return result
+    # Ensure uniqueness; sort once here so completion never has to
+    commands = {c for c in COMMON_COMMANDS + learned if isinstance(c, str)}
+    return tuple(sorted(commands))
 
 # Completer factory returns a function suitable for readline.set_completer()
 def make_completer(command_list_getter=_get_dynamic_commands):
     """
     Returns a completer(text, state) using `command_list_getter()` to fetch commands.
     - If completing first word -> use commands list (prefix match).
-    - Else -> filename completion (glob + os.listdir).
+    - Else -> filename completion (os.scandir).
     """
     def completer(text, state):
         # If readline not available, can't do completions
         if readline is None:
             return None
 
-        # Determine buffer and current word index
-        buf = readline.get_line_buffer()
-        begidx = readline.get_begidx()
-        endidx = readline.get_endidx()
-        # Extract everything typed up to cursor
-        before_cursor = buf[:begidx]
-        words = before_cursor.split()
-
-        # If we are completing the first word (command)
-        if len(words) == 0:
-            # cursor is at first word (no preceding words)
-            candidates = _command_candidates(text, command_list_getter)
-        elif begidx == 0 and buf.strip() == "":  # starting first word but no words yet
-            candidates = _command_candidates(text, command_list_getter)
-        elif len(words) == 1 and begidx <= len(words[0]):
-            # completing the first word (partial)
-            candidates = _command_candidates(text, command_list_getter)
-        else:
-            # Completing an argument -> filename completion
-            candidates = _filename_candidates(text)
-
-        # Sort for determinism; readline will iterate by state index
-        candidates = sorted(candidates)
+        # Readline calls us with state 0, 1, 2, ... for the same word; only
+        # build the candidate list on the first call and reuse it for the
+        # rest. Each new completion starts fresh, so the files on disk and
+        # the cwd are never stale.
+        if state == 0:
+            buf = readline.get_line_buffer()
+            begidx = readline.get_begidx()
+            if _is_first_word(buf, begidx):
+                completer._cache = _command_candidates(text, command_list_getter)
+            else:
+                # Completing an argument -> filename completion
+                completer._cache = sorted(_filename_candidates(text))
         try:
-            return candidates[state]
+            return completer._cache[state]
         except IndexError:
             return None
 
+    completer._cache = []
     return completer
 
+def _is_first_word(buf, begidx):
+    """True if the word starting at begidx is the command (first word)."""
+    # Extract everything typed up to cursor
+    before_cursor = buf[:begidx]
+    words = before_cursor.split()
+
+    if len(words) == 0:
+        # cursor is at first word (no preceding words)
+        return True
+    if begidx == 0 and buf.strip() == "":  # starting first word but no words yet
+        return True
+    if len(words) == 1 and begidx <= len(words[0]):
+        # completing the first word (partial)
+        return True
+    return False
+
 def _command_candidates(text, command_list_getter):
-    """Return list of commands that start with text (case-sensitive)."""
+    """Return sorted commands that start with text (case-sensitive)."""
     commands = command_list_getter()
     if not text:
-        return commands[:]
-    return [c for c in commands if c.startswith(text)]
+        return list(commands)
+    # Matches form a contiguous run in the sorted list: bisect to its start
+    # and stop at the first non-match.
+    out = []
+    i = bisect.bisect_left(commands, text)
+    while i < len(commands) and commands[i].startswith(text):
+        out.append(commands[i])
+        i += 1
+    return out
 
 def _filename_candidates(text):
     """
@@ -114,21 +135,20 @@ def _filename_candidates(text):
     # Expand ~ and variables
     prefix = os.path.expanduser(os.path.expandvars(prefix))
 
-    # If prefix ends with a slash, glob everything inside
-    if prefix.endswith(os.sep):
-        pattern = prefix + "*"
-    else:
-        pattern = prefix + "*"
-
-    matches = glob.glob(pattern)
-    # Add trailing slash for directories to signal completion
-    out = []
-    for m in matches:
-        if os.path.isdir(m):
-            out.append(m + os.sep)
-        else:
-            out.append(m)
-    return out
+    # One directory scan; entry types come from the dirent, so no stat()
+    # per match. Like glob, hidden entries only match a leading '.'.
+    dirname, basename = os.path.split(prefix)
+    show_hidden = basename.startswith(".")
+    try:
+        with os.scandir(dirname or ".") as it:
+            return [
+                os.path.join(dirname, entry.name) + (os.sep if entry.is_dir() else "")
+                for entry in it
+                if entry.name.startswith(basename)
+                and (show_hidden or not entry.name.startswith("."))
+            ]
+    except OSError:
+        return []
 
 def setup_autocomplete(bind_tab=True, command_list_getter=_get_dynamic_commands):
     """
@@ -136,8 +156,8 @@ def setup_autocomplete(bind_tab=True, command_list_getter=_get_dynamic_commands)
 
     Parameters:
     - bind_tab: if True, pressing TAB invokes completion (default True)
-    - command_list_getter: function returning the list of commands; used to keep
-      the completions dynamic (pass a lambda that calls load_learned_commands()).
+    - command_list_getter: function returning the sorted list of commands; used to
+      keep the completions dynamic (pass a lambda that calls load_learned_commands()).
     """
     global readline  # <-- important fix: we now modify the global variable
 
@@ -8,7 +8,10 @@ COMMON_COMMANDS = [
     "tail", "sort", "chmod", "chown", "man", "less", "more", "git"
 ]
 
-LEARN_FILE = "learned_cmds.json"
+# One command per line. The old JSON list is still read if the text file
+# is missing.
+LEARN_FILE = "learned_cmds.txt"
+LEGACY_LEARN_FILE = "learned_cmds.json"
 
 # ---------------------------------------------------------------------
 # Predefined typo map: most common real-world misspellings per command
@@ -111,24 +114,99 @@ COMMON_TYPOS = {
     ]
 }
 
-# Reverse mapping for O(1) correction lookup
-TYPO_CORRECTIONS = {typo: cmd for cmd, typos in COMMON_TYPOS.items() for typo in typos}
+# Reverse mapping for O(1) correction lookup. It is shipped pre-built as a
+# literal in _typos.py so importing autocorrect does not rebuild it.
+from _typos import TYPO_CORRECTIONS
+
+TYPO_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_typos.py")
+
+def write_typo_table(path=TYPO_FILE):
+    """Regenerate _typos.py from COMMON_TYPOS (run after editing the table)."""
+    corrections = {typo: cmd for cmd, typos in COMMON_TYPOS.items() for typo in typos}
+    lines = [
+        "# _typos.py",
+        '"""',
+        "Typo -> command table for autocorrect, generated from",
+        "autocorrect.COMMON_TYPOS so importing it does no work at startup.",
+        "",
+        "Regenerate after editing COMMON_TYPOS:",
+        '    python -c "import autocorrect; autocorrect.write_typo_table()"',
+        '"""',
+        "",
+        "TYPO_CORRECTIONS = {",
+    ]
+    lines += [f"    {json.dumps(typo)}: {json.dumps(cmd)}," for typo, cmd in corrections.items()]
+    lines.append("}")
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
 
 # ---------------------------------------------------------------------
 # Load learned commands — READ ONLY
 # ---------------------------------------------------------------------
+# The learned file is cached in memory and only re-read when its mtime
+# changes, so the hot path never opens or parses it.
+_LEARNED_CACHE = None
+_LEARNED_MTIME = None
+_LEARNED_LISTENERS = []
+
+def on_learned_change(callback):
+    """Register callback() to run whenever the learned commands are reloaded."""
+    _LEARNED_LISTENERS.append(callback)
+
+def _read_learned_file():
+    """Read LEARN_FILE, or the legacy JSON file if it doesn't exist."""
+    try:
+        with open(LEARN_FILE, "r") as f:
+            return [line for line in f.read().splitlines() if line]
+    except OSError:
+        pass
+    try:
+        with open(LEGACY_LEARN_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+
+def _refresh_learned():
+    """Reload LEARN_FILE into the cache if it changed on disk."""
+    global _LEARNED_CACHE, _LEARNED_MTIME
+    try:
+        mtime = os.stat(LEARN_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _LEARNED_CACHE is not None and mtime == _LEARNED_MTIME:
+        return
+
+    _LEARNED_CACHE = _read_learned_file()
+    _LEARNED_MTIME = mtime
+    _rebuild_corrections()
+    for callback in _LEARNED_LISTENERS:
+        callback()
+
+# ---------------------------------------------------------------------
+# Merged lowercase correction table
+# ---------------------------------------------------------------------
+# Learned commands, COMMON_COMMANDS and typos folded into one dict so that
+# autocorrect is a single hash probe. Later layers win on conflicts.
+# _VALID holds commands that already correct to themselves (e.g. "ls").
+_CORRECTIONS = {}
+_VALID = frozenset()
+
+def _rebuild_corrections():
+    """Re-merge the correction table after the learned cache changes."""
+    global _CORRECTIONS, _VALID
+    merged = {c.lower(): c for c in reversed(_LEARNED_CACHE or [])}
+    merged.update((c.lower(), c) for c in COMMON_COMMANDS)
+    merged.update(TYPO_CORRECTIONS)
+    _CORRECTIONS = merged
+    _VALID = frozenset(k for k, v in merged.items() if k == v)
+
 def load_learned_commands():
     """Load predefined learned commands, but never modify the file."""
-    if os.path.exists(LEARN_FILE):
-        try:
-            with open(LEARN_FILE, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return []
-    return []
+    _refresh_learned()
+    return _LEARNED_CACHE
 
 def learn_command(command):
-    """Disabled learning — does nothing."""
+    """Disabled learning — does nothing (no file I/O on the command path)."""
     return
 
 # ---------------------------------------------------------------------
@@ -136,21 +214,13 @@ def learn_command(command):
 # ---------------------------------------------------------------------
 def autocorrect_command(command):
     """
-    Fast and reliable autocorrect:
-    1. Checks against predefined typo list.
-    2. Falls back to learned commands (read-only).
+    Fast and reliable autocorrect: a single lookup in the merged table of
+    predefined typos, known commands and learned commands (read-only).
+    Unknown commands are returned as is.
     """
-    cmd_lower = command.lower()
-
-    # Step 1: direct typo correction
-    if cmd_lower in TYPO_CORRECTIONS:
-        return TYPO_CORRECTIONS[cmd_lower]
+    if command in _VALID:
+        return command
+    return _CORRECTIONS.get(command.lower(), command)
 
-    # Step 2: check learned commands (read-only)
-    learned = load_learned_commands()
-    for learned_cmd in learned:
-        if cmd_lower == learned_cmd.lower():
-            return learned_cmd
 
-    # Step 3: no correction — return as is
-    return command
+_refresh_learned()
@@ -5,21 +5,107 @@ Provides human-friendly error explanations and colored tips.
 """
 
 import re
+import sys
 import difflib
+import functools
+import heapq
 import os
 from colorama import Fore, Style, init
 
-# Initialize colorama for colored output (works on Windows too)
-init(autoreset=True)
+# Optional: rapidfuzz's C++ matcher is much faster than difflib on large
+# vocabularies/directories. Fall back to difflib if it isn't installed.
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+# Optional: pyahocorasick matches every error phrase in a single DFA pass.
+# Fall back to the fused regex if it isn't installed.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that yields empty codes."""
+    def __getattr__(self, name):
+        return ""
+
+# Only color real terminals, and honor NO_COLOR (https://no-color.org).
+# Every message resets its own colors, so colorama's autoreset stream
+# wrapper (which re-parses each print) isn't needed.
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    Fore = Style = _NoColor()
+else:
+    try:
+        from colorama import just_fix_windows_console
+    except ImportError:  # colorama < 0.4.6
+        # Initialize colorama for colored output (works on Windows too)
+        init(autoreset=True)
+    else:
+        just_fix_windows_console()
+
+
+def _best_match(word, choices):
+    """Return the choice most similar to word (at least 60% alike), or None."""
+    if process is not None:
+        hit = process.extractOne(word, choices, scorer=fuzz.ratio, score_cutoff=60)
+        return hit[0] if hit else None
+    matches = _close_matches(word, choices, n=1, cutoff=0.6)
+    return matches[0] if matches else None
+
+def _close_matches(word, choices, n, cutoff):
+    """difflib.get_close_matches() without autojunk, for the fallback path.
+
+    One matcher is reused with `word` as the cached second sequence, the
+    cheap upper bounds filter candidates, and ratio() runs once each.
+    """
+    matcher = difflib.SequenceMatcher(autojunk=False)
+    matcher.set_seq2(word)
+    scored = []
+    for choice in choices:
+        matcher.set_seq1(choice)
+        if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+            score = matcher.ratio()
+            if score >= cutoff:
+                scored.append((score, choice))
+    return [choice for _, choice in heapq.nlargest(n, scored)]
 
 # --- Helper: Closest command suggestion ---
-from autocorrect import COMMON_COMMANDS, load_learned_commands
+from autocorrect import COMMON_COMMANDS, load_learned_commands, on_learned_change
 
+_ALL_CMDS_CACHE = None
+_ALL_CMDS_SET = None
+
+def _all_cmds():
+    """COMMON_COMMANDS + learned commands as one tuple, built once."""
+    global _ALL_CMDS_CACHE
+    if _ALL_CMDS_CACHE is None:
+        _ALL_CMDS_CACHE = tuple(COMMON_COMMANDS) + tuple(load_learned_commands())
+    return _ALL_CMDS_CACHE
+
+def _all_cmds_set():
+    """The same vocabulary as a frozenset, for O(1) membership checks."""
+    global _ALL_CMDS_SET
+    if _ALL_CMDS_SET is None:
+        _ALL_CMDS_SET = frozenset(_all_cmds())
+    return _ALL_CMDS_SET
+
+@functools.lru_cache(maxsize=256)
 def closest_command(cmd):
-    """Suggest the closest known or learned command."""
-    all_cmds = COMMON_COMMANDS + load_learned_commands()
-    matches = difflib.get_close_matches(cmd, all_cmds, n=1, cutoff=0.6)
-    return matches[0] if matches else "help"
+    """Suggest the closest known or learned command (memoized)."""
+    if cmd in _all_cmds_set():
+        return cmd  # exact match: nothing can score higher
+    return _best_match(cmd, _all_cmds()) or "help"
+
+def _forget_learned():
+    """Drop cached vocabulary so new learned commands become visible."""
+    global _ALL_CMDS_CACHE, _ALL_CMDS_SET
+    _ALL_CMDS_CACHE = _ALL_CMDS_SET = None
+    closest_command.cache_clear()
+
+on_learned_change(_forget_learned)
 
 # --- Helper: Suggest closest filename ---
 def suggest_similar_file(filename):
@@ -27,111 +113,206 @@ def suggest_similar_file(filename):
     try:
         dirname = os.path.dirname(filename) or "."
         basename = os.path.basename(filename)
-        if not os.path.exists(dirname):
-            return None
-        files = os.listdir(dirname)
-        matches = difflib.get_close_matches(basename, files, n=1, cutoff=0.6)
-        if matches:
-            return os.path.join(dirname, matches[0])
-    except Exception:
+        # One directory scan; an exact name ends it without fuzzy matching
+        names = []
+        with os.scandir(dirname) as entries:
+            for entry in entries:
+                if entry.name == basename:
+                    return os.path.join(dirname, basename)
+                names.append(entry.name)
+        match = _best_match(basename, names)
+        if match:
+            return os.path.join(dirname, match)
+    except (OSError, ValueError):  # missing/unreadable dir, NUL in path, ...
         return None
     return None
 
 
-# --- Core analyzer ---
-def analyze_error(command, stderr_output):
-    """
-    Analyze command errors and return a friendly message with colored hints.
-    """
-    msg = stderr_output.lower()
-    base_cmd = command.split()[0] if command else "command"
+# --- Error patterns ---
+# (name, pattern, suggestion), in priority order: the errors users hit most
+# (permissions, unknown commands, missing files) come first, and a hit on
+# the top pattern ends the scan early. Suggestions are templates:
+# {base_cmd} is the failing command's name and {closest} the closest known
+# command; both are only filled in after a pattern matches.
+_ERROR_PATTERNS = (
+    # Permission-related
+    ("permission", r"permission denied",
+     f"{Fore.YELLOW}Permission denied.{Style.RESET_ALL} 💡 Try running with elevated privileges or fix ownership using {Fore.CYAN}chmod/chown{Style.RESET_ALL}."),
 
-    # Large set of pattern-suggestion pairs
-    error_patterns = [
-        # File-related
-        (r"no such file or directory",
-         f"{Fore.YELLOW}File not found.{Style.RESET_ALL} 💡 Try creating it using → {Fore.CYAN}touch <filename>{Style.RESET_ALL}"),
+    # Command-related
+    ("cmdnotfound", r"command not found",
+     f"{Fore.YELLOW}Unknown command.{Style.RESET_ALL} 💡 Did you mean → {Fore.CYAN}{{closest}}{Style.RESET_ALL}?"),
 
-        (r"file exists",
-         f"{Fore.YELLOW}File or directory already exists.{Style.RESET_ALL} 💡 Try using a different name or remove the existing one."),
+    ("notrecognized", r"not recognized as an internal or external command",
+     f"{Fore.YELLOW}Unrecognized command on Windows.{Style.RESET_ALL} 💡 Did you mean → {Fore.CYAN}{{closest}}{Style.RESET_ALL}?"),
 
-        (r"is a directory",
-         f"{Fore.YELLOW}You’re trying to use a directory as a file.{Style.RESET_ALL} 💡 Use {Fore.CYAN}cd <dir>{Style.RESET_ALL} or specify a file path."),
+    # File-related
+    ("nosuchfile", r"no such file or directory",
+     f"{Fore.YELLOW}File not found.{Style.RESET_ALL} 💡 Try creating it using → {Fore.CYAN}touch <filename>{Style.RESET_ALL}"),
 
-        (r"not a directory",
-         f"{Fore.YELLOW}You’re trying to access a file as a directory.{Style.RESET_ALL} 💡 Check your path or file extension."),
+    ("fileexists", r"file exists",
+     f"{Fore.YELLOW}File or directory already exists.{Style.RESET_ALL} 💡 Try using a different name or remove the existing one."),
 
-        # Permission-related
-        (r"permission denied",
-         f"{Fore.YELLOW}Permission denied.{Style.RESET_ALL} 💡 Try running with elevated privileges or fix ownership using {Fore.CYAN}chmod/chown{Style.RESET_ALL}."),
+    ("isadir", r"is a directory",
+     f"{Fore.YELLOW}You’re trying to use a directory as a file.{Style.RESET_ALL} 💡 Use {Fore.CYAN}cd <dir>{Style.RESET_ALL} or specify a file path."),
 
-        # Command-related
-        (r"command not found",
-         f"{Fore.YELLOW}Unknown command.{Style.RESET_ALL} 💡 Did you mean → {Fore.CYAN}{closest_command(base_cmd)}{Style.RESET_ALL}?"),
+    ("notadir", r"not a directory",
+     f"{Fore.YELLOW}You’re trying to access a file as a directory.{Style.RESET_ALL} 💡 Check your path or file extension."),
 
-        (r"not recognized as an internal or external command",
-         f"{Fore.YELLOW}Unrecognized command on Windows.{Style.RESET_ALL} 💡 Did you mean → {Fore.CYAN}{closest_command(base_cmd)}{Style.RESET_ALL}?"),
+    # Syntax / invalid option
+    ("invalidoption", r"invalid option",
+     f"{Fore.YELLOW}Invalid option used.{Style.RESET_ALL} 💡 Try {Fore.CYAN}man {{base_cmd}}{Style.RESET_ALL} or {Fore.CYAN}{{base_cmd}} --help{Style.RESET_ALL}."),
 
-        # Syntax / invalid option
-        (r"invalid option",
-         f"{Fore.YELLOW}Invalid option used.{Style.RESET_ALL} 💡 Try {Fore.CYAN}man {base_cmd}{Style.RESET_ALL} or {Fore.CYAN}{base_cmd} --help{Style.RESET_ALL}."),
+    ("invalidargument", r"invalid argument",
+     f"{Fore.YELLOW}Invalid argument provided.{Style.RESET_ALL} 💡 Check command usage with {Fore.CYAN}{{base_cmd}} --help{Style.RESET_ALL}."),
 
-        (r"invalid argument",
-         f"{Fore.YELLOW}Invalid argument provided.{Style.RESET_ALL} 💡 Check command usage with {Fore.CYAN}{base_cmd} --help{Style.RESET_ALL}."),
+    ("syntaxerror", r"syntax error",
+     f"{Fore.YELLOW}Syntax error detected.{Style.RESET_ALL} 💡 Verify your command format or quotes."),
 
-        (r"syntax error",
-         f"{Fore.YELLOW}Syntax error detected.{Style.RESET_ALL} 💡 Verify your command format or quotes."),
+    # Network
+    ("netunreachable", r"network is unreachable",
+     f"{Fore.YELLOW}Network unreachable.{Style.RESET_ALL} 💡 Check your internet connection or VPN."),
 
-        # Disk / IO errors
-        (r"no space left on device",
-         f"{Fore.YELLOW}Disk is full.{Style.RESET_ALL} 💡 Clear space or delete unnecessary files."),
+    ("connrefused", r"connection refused",
+     f"{Fore.YELLOW}Connection refused.{Style.RESET_ALL} 💡 Ensure the target service is running and reachable."),
 
-        (r"input/output error",
-         f"{Fore.YELLOW}I/O Error encountered.{Style.RESET_ALL} 💡 Check device or disk health."),
+    ("dns", r"temporary failure in name resolution",
+     f"{Fore.YELLOW}DNS issue.{Style.RESET_ALL} 💡 Check your network configuration or try again later."),
 
-        # Network
-        (r"network is unreachable",
-         f"{Fore.YELLOW}Network unreachable.{Style.RESET_ALL} 💡 Check your internet connection or VPN."),
+    # Disk / IO errors
+    ("nospace", r"no space left on device",
+     f"{Fore.YELLOW}Disk is full.{Style.RESET_ALL} 💡 Clear space or delete unnecessary files."),
 
-        (r"connection refused",
-         f"{Fore.YELLOW}Connection refused.{Style.RESET_ALL} 💡 Ensure the target service is running and reachable."),
+    ("ioerror", r"input/output error",
+     f"{Fore.YELLOW}I/O Error encountered.{Style.RESET_ALL} 💡 Check device or disk health."),
 
-        (r"temporary failure in name resolution",
-         f"{Fore.YELLOW}DNS issue.{Style.RESET_ALL} 💡 Check your network configuration or try again later."),
+    # Process / memory
+    ("nomemory", r"cannot allocate memory",
+     f"{Fore.YELLOW}Out of memory.{Style.RESET_ALL} 💡 Close other programs or increase system memory."),
 
-        # Process / memory
-        (r"cannot allocate memory",
-         f"{Fore.YELLOW}Out of memory.{Style.RESET_ALL} 💡 Close other programs or increase system memory."),
+    # Miscellaneous
+    ("badinterpreter", r"bad interpreter",
+     f"{Fore.YELLOW}Bad interpreter path in script.{Style.RESET_ALL} 💡 Check the shebang (#!) line in your script."),
 
-        # Miscellaneous
-        (r"bad interpreter",
-         f"{Fore.YELLOW}Bad interpreter path in script.{Style.RESET_ALL} 💡 Check the shebang (#!) line in your script."),
+    ("notpermitted", r"operation not permitted",
+     f"{Fore.YELLOW}Operation not permitted.{Style.RESET_ALL} 💡 You may need admin/root privileges."),
+)
 
-        (r"operation not permitted",
-         f"{Fore.YELLOW}Operation not permitted.{Style.RESET_ALL} 💡 You may need admin/root privileges."),
-    ]
+# All patterns fused into one alternation so stderr is scanned once; the
+# named group that matched identifies the pattern.
+# IGNORECASE means stderr never has to be lower-cased first.
+_COMBINED = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _ERROR_PATTERNS),
+    re.IGNORECASE,
+)
+_PRIORITY = {name: i for i, (name, _, _) in enumerate(_ERROR_PATTERNS)}
+_PHRASE_LEN = {name: len(pattern) for name, pattern, _ in _ERROR_PATTERNS}
+
+# Every pattern is a plain phrase, so with pyahocorasick they can also be
+# loaded into an Aho-Corasick automaton (matched against lower-cased text).
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _name, _phrase, _ in _ERROR_PATTERNS:
+        _AUTOMATON.add_word(_phrase, _name)
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
+
+# Only these suggestions need the (comparatively expensive) closest_command().
+_NEEDS_CLOSEST = frozenset(name for name, _, template in _ERROR_PATTERNS if "{closest}" in template)
+
+# The last quoted path in an error message, e.g. ls: cannot access 'foo': ...
+_FILENAME_RX = re.compile(r"['\"]([^'\"]+)['\"][^'\"]*$")
+_FILENAME_AFTER_RX = re.compile(r"['\"]([^'\"]+)['\"]")
+
+def _missing_filename(stderr_output, start):
+    """Pull the missing path out of the line around a 'no such file' hit."""
+    line_start = stderr_output.rfind("\n", 0, start) + 1
+    before = stderr_output[line_start:start]
+    quoted = _FILENAME_RX.search(before)
+    if quoted:
+        return quoted.group(1)
+    # Python-style form, e.g. "[Errno 2] No such file or directory: 'foo'"
+    after_start = start + _PHRASE_LEN["nosuchfile"]
+    line_end = stderr_output.find("\n", after_start)
+    quoted = _FILENAME_AFTER_RX.search(stderr_output, after_start,
+                                       len(stderr_output) if line_end == -1 else line_end)
+    if quoted:
+        return quoted.group(1)
+    # Unquoted form, e.g. "cat: foo.txt: No such file or directory"
+    tokens = before.split()
+    return tokens[-1].strip(":") if tokens else None
+
+# Remaining colored messages, built once rather than per error.
+_UNRECOGNIZED = f"{Fore.YELLOW}Unrecognized error.{Style.RESET_ALL} 💡 Try checking the command syntax or path."
+_SIMILAR_FILE_TMPL = f"\n{Fore.YELLOW}💡 Did you mean: {Fore.CYAN}{{alt}}{Style.RESET_ALL}?"
+_ERROR_HEADER_TMPL = f"{Fore.RED}[!] Error running command: {{command}}{Style.RESET_ALL}"
+
+
+def _add_similar_file_hint(stderr_output, start, suggestion):
+    """'no such file' follow-up: point at a similarly named existing file."""
+    filename = _missing_filename(stderr_output, start)
+    if filename:
+        alt = suggest_similar_file(filename)
+        if alt:
+            suggestion += _SIMILAR_FILE_TMPL.format(alt=alt)
+    return suggestion
+
+# name -> (template, post_handler). A post handler refines the formatted
+# suggestion using the stderr text and the match position.
+_POST_HANDLERS = {"nosuchfile": _add_similar_file_hint}
+_DISPATCH = {name: (template, _POST_HANDLERS.get(name)) for name, _, template in _ERROR_PATTERNS}
+
+
+# --- Core analyzer ---
+def _find_error(stderr_output):
+    """Return (name, start) of the highest-priority error phrase, or None.
+
+    One scan either way; the best hit wins as if the table were tried top
+    to bottom. The automaton needs lower-cased text, so it is only used for
+    ASCII input, where lowering keeps offsets stable.
+    """
+    if _AUTOMATON is not None and stderr_output.isascii():
+        hits = ((name, end - _PHRASE_LEN[name] + 1)
+                for end, name in _AUTOMATON.iter(stderr_output.lower()))
+    else:
+        hits = ((m.lastgroup, m.start()) for m in _COMBINED.finditer(stderr_output))
+
+    best = None
+    for name, start in hits:
+        if best is None or _PRIORITY[name] < _PRIORITY[best[0]]:
+            best = (name, start)
+            if _PRIORITY[name] == 0:
+                break  # nothing can outrank the top pattern
+    return best
+
+def analyze_error(command, stderr_output):
+    """
+    Analyze command errors and return a friendly message with colored hints.
+    """
+    base_cmd = command.partition(" ")[0] if command else "command"
 
-    # Pattern matching
-    for pattern, suggestion in error_patterns:
-        if re.search(pattern, msg):
-            # Special case: file not found — suggest similar
-            if "no such file" in msg:
-                match = re.search(r"['\"]?([^'\"]+)['\"]?", stderr_output)
-                if match:
-                    filename = match.group(1)
-                    alt = suggest_similar_file(filename)
-                    if alt:
-                        suggestion += f"\n{Fore.YELLOW}💡 Did you mean: {Fore.CYAN}{alt}{Style.RESET_ALL}?"
-            return suggestion
+    hit = _find_error(stderr_output)
+    if hit:
+        name, start = hit
+        template, post_handler = _DISPATCH[name]
+        if name in _NEEDS_CLOSEST:
+            suggestion = template.format(base_cmd=base_cmd, closest=closest_command(base_cmd))
+        else:
+            suggestion = template.format(base_cmd=base_cmd)
+        if post_handler is not None:
+            suggestion = post_handler(stderr_output, start, suggestion)
+        return suggestion
 
     # No known pattern matched
-    return f"{Fore.YELLOW}Unrecognized error.{Style.RESET_ALL} 💡 Try checking the command syntax or path."
+    return _UNRECOGNIZED
 
 
 def display_error(command, stderr_output):
-    """Prints the error and friendly insights in color."""
-    print(f"{Fore.RED}[!] Error running command: {command}{Style.RESET_ALL}")
-    print(stderr_output.strip())
+    """Prints the error and friendly insights in color, in a single write."""
+    parts = [_ERROR_HEADER_TMPL.format(command=command), stderr_output.strip()]
     insight = analyze_error(command, stderr_output)
     if insight:
-        print(insight)
\ No newline at end of file
+        parts.append(insight)
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()